@@ -1,7 +1,7 @@
-from src.utility.SdValidator import SdValidator
+from src.utility.SdValidator import get_validator
 
 
-_configini = SdValidator()
+_configini = get_validator()
 
 _elastic_config = _configini.get_elastic_config()
 
@@ -11,11 +11,15 @@ ES_PASSWORD: str = _elastic_config.es_password
 ES_TIMEOUT: int = int( _elastic_config.es_timeout )
 ES_INDEX_NAME: str = _elastic_config.es_index_name
 ES_FIELD: str = _elastic_config.es_field
+ES_FIELD_PATH: tuple = tuple(_elastic_config.es_field.split('.'))
 
 _engine_config = _configini.get_engine_config()
 
 BATCH_SIZE: int = int( _engine_config.batch_size )
 MAX_RETRY_CONNECTION: int = int(_engine_config.max_retry_connection)
+MAX_CHUNK_BYTES: int = int(_engine_config.max_chunk_bytes)
+QUEUE_SIZE: int = int(_engine_config.queue_size)
+SCAN_SIZE: int = int(_engine_config.scan_size)
 FORMAT_DATE: str = _engine_config.format_date
 
 _query_config = _configini.get_query_config()
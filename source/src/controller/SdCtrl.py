@@ -1,15 +1,12 @@
 from typing import Dict, List, Any, Generator
 
-from src.model import MappingData
 from src.config import SdConfig
 from src.library.SdElastic import SdElasticConnect
 from src.utility.SdUtility import (
-    argToJson, 
-    timestampToDate, 
-    templateIndex, 
+    timestampToDate,
+    templateIndex,
     getNestedValue,
-    dateToEpoch,
-    validateTimestampQuery)
+    dateToEpoch)
 
 
 class SdController:
@@ -19,7 +16,29 @@ class SdController:
         self.es: SdElasticConnect = None
         self.gte = None
         self.lte = None
-    
+        self._indexCache: Dict[int, str] = {}
+        self._passes = None
+
+    def _buildTimestampPredicate(self):
+        """
+        Specializes the timestamp filter once per run. The gte/lte bounds
+        are constant for the whole ingest, so the branch ladder is decided
+        here instead of once per document.
+        """
+        if self.config.USED_QUERY == "no":
+            self._passes = None
+            return
+
+        gte, lte = self.gte, self.lte
+        if self.config.GTE and self.config.LTE:
+            self._passes = lambda ts: gte <= ts <= lte
+        elif self.config.GTE:
+            self._passes = lambda ts: ts >= gte
+        elif self.config.LTE:
+            self._passes = lambda ts: ts <= lte
+        else:
+            self._passes = None
+
     def getData(self):
         if self.config.USED_QUERY == "no":
             datas: Generator[Any, None, None] = self.es.searchAll()
@@ -32,31 +51,34 @@ class SdController:
                 self.lte = self.config.LTE
 
             datas: Generator[Any, None, None] = self.es.searchQuery(self.gte, self.lte)
+
+        self._buildTimestampPredicate()
         return datas
 
     def mappingData(self, data: Dict[Any, None]):
-        id: str = data.get("_id", None)
-        source: Dict[Any, None] = data.get("_source", {})
-        timestamp: int = getNestedValue(source, self.config.ES_FIELD)
-        date: str = timestampToDate(timestamp, self.config.FORMAT_DATE)
-        indexName: str = templateIndex(self.config.ES_INDEX_NAME, date)
-
-        data: MappingData = MappingData(**argToJson(
-            dataId=id,
-            indexName=indexName,
-            data=source
-        ))
+        # Every hit carries _id and _source; let a malformed one raise.
+        id: str = data["_id"]
+        source: Dict[Any, None] = data["_source"]
+        timestamp: int = getNestedValue(source, self.config.ES_FIELD_PATH)
 
-        if self.config.USED_QUERY == "no":
-            pass
+        # Documents in the same day bucket share one index name, so the
+        # strftime + format work only runs once per bucket.
+        bucket: int = timestamp // 86400
+        indexName: str = self._indexCache.get(bucket)
+        if indexName is None:
+            date: str = timestampToDate(timestamp, self.config.FORMAT_DATE)
+            indexName = templateIndex(self.config.ES_INDEX_NAME, date)
+            self._indexCache[bucket] = indexName
 
-        else:
-            if validateTimestampQuery(
-                self.config.GTE, self.config.LTE, timestamp,
-                self.gte, self.lte):
+        # Emit the bulk action directly; the shared indexName string comes
+        # from the bucket cache, so this is the only per-document dict.
+        action = {
+            "_index": indexName,
+            "_id": id,
+            "_source": source
+        }
 
-                return data.model_dump()
-            
+        if self._passes is not None and not self._passes(timestamp):
             return {}
 
-        return data.model_dump()
\ No newline at end of file
+        return action
\ No newline at end of file
@@ -1,8 +1,41 @@
+import orjson
+
+from queue import Queue
+from threading import Thread
 from loguru import logger
-from elasticsearch.helpers import scan, bulk
+from elasticsearch.helpers import scan, bulk, parallel_bulk
+from elasticsearch.serializer import JSONSerializer
 from elasticsearch import Elasticsearch
 
 from src.config import SdConfig
+from src.utility.SdUtility import numProcess
+
+
+class ORJSONSerializer(JSONSerializer):
+    """JSON serializer backed by orjson for faster bulk payload encoding."""
+
+    def dumps(self, data):
+        # Pre-encoded bodies (the NDJSON str the bulk helpers join) must
+        # pass through untouched, like the base serializer does; orjson
+        # would happily re-encode them into one quoted JSON string.
+        if isinstance(data, str):
+            return data
+
+        try:
+            # The client's bulk helpers expect str output and encode it
+            # themselves, so decode orjson's bytes buffer.
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except (orjson.JSONEncodeError, TypeError):
+            # Fall back to the default serializer for types orjson rejects.
+            return super().dumps(data)
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except (ValueError, TypeError):
+            # Let the base serializer raise its own SerializationError so
+            # callers see the same error type as with the stock client.
+            return super().loads(data)
 
 
 class SdElasticConnect:
@@ -11,7 +44,9 @@ class SdElasticConnect:
         self.config: SdConfig = config
         self.connectEs = None
         self.configEs = None
-    
+        self._savedSettings = {}
+        self._preparedIndices = set()
+
     def connect(self):
         self.logger.info(f"Attempting to connect to Elasticsearch configuration: {self.config.ES_URL}")
         if self.config:
@@ -19,7 +54,10 @@ class SdElasticConnect:
                 self.connectEs = Elasticsearch(
                     hosts=self.config.ES_URL,
                     http_auth=(self.config.ES_USERNAME, self.config.ES_PASSWORD),
-                    timeout=self.config.ES_TIMEOUT
+                    timeout=self.config.ES_TIMEOUT,
+                    retry_on_timeout=True,
+                    max_retries=self.config.MAX_RETRY_CONNECTION,
+                    serializer=ORJSONSerializer()
                 )
 
                 if self.connectEs.ping():
@@ -37,23 +75,76 @@ class SdElasticConnect:
         return {"query": {"match_all": {}}}
     
 
-    def searchAll(self):
-        self.logger.debug(f"Starting search operation on index: {self.config.ES_INDEX_NAME}")        
-        indexName = self.config.ES_INDEX_NAME
-        query = self._buildQueryMatchAll()
+    def _scanSliced(self, indexName: str, query: dict):
+        """
+        Runs a sliced scroll across worker threads and yields hits as they
+        arrive, so the read side scales with the index's shards instead of
+        a single serial scroll. Falls back to a plain scan for one worker.
+        """
+        maxSlices = numProcess()
 
-        try:
-            self.logger.debug("Executing Elasticsearch scan query...")
-            result = scan(
-                self.connectEs, 
-                index=indexName, 
+        if maxSlices <= 1:
+            yield from scan(
+                self.connectEs,
+                index=indexName,
                 query=query,
-                size=1000,
+                size=self.config.SCAN_SIZE,
                 scroll='5m',
-                preserve_order=True,
                 request_timeout=self.config.ES_TIMEOUT,
                 headers={"Content-Type": "application/json"})
-            self.logger.success(f"Search completed successfully.")
+            return
+
+        hits = Queue(maxsize=maxSlices * 1000)
+        sentinel = object()
+        failures = []
+
+        def scanSlice(sliceId: int):
+            try:
+                slicedQuery = dict(query)
+                slicedQuery["slice"] = {"id": sliceId, "max": maxSlices}
+                for hit in scan(
+                        self.connectEs,
+                        index=indexName,
+                        query=slicedQuery,
+                        size=self.config.SCAN_SIZE,
+                        scroll='5m',
+                        request_timeout=self.config.ES_TIMEOUT,
+                        headers={"Content-Type": "application/json"}):
+                    hits.put(hit)
+            except Exception as e:
+                self.logger.error(f"Slice {sliceId}: scroll error: {e}")
+                failures.append(e)
+            finally:
+                hits.put(sentinel)
+
+        workers = [
+            Thread(target=scanSlice, args=(sliceId,), daemon=True)
+            for sliceId in range(maxSlices)]
+        for worker in workers:
+            worker.start()
+
+        finished = 0
+        while finished < maxSlices:
+            hit = hits.get()
+            if hit is sentinel:
+                finished += 1
+                continue
+            yield hit
+
+        # A failed slice means the read was partial; surface it instead of
+        # letting the caller treat the truncated stream as a full scan.
+        if failures:
+            raise failures[0]
+
+    def searchAll(self):
+        self.logger.debug(f"Starting search operation on index: {self.config.ES_INDEX_NAME}")
+        indexName = self.config.ES_INDEX_NAME
+        query = self._buildQueryMatchAll()
+
+        try:
+            self.logger.debug("Executing Elasticsearch sliced scan query...")
+            result = self._scanSliced(indexName, query)
+            self.logger.success(f"Search started successfully.")
             return result
         except Exception as e:
             self.logger.error(f"Error while searching data in index '{indexName}': {e}", exc_info=True)
@@ -109,35 +200,130 @@ class SdElasticConnect:
             self.config.SORT_ORDER)
 
         try:
-            self.logger.debug("Executing Elasticsearch scan query...")
-            result = scan(
-                self.connectEs, 
-                index=indexName,
-                query=query, 
-                size=1000,
-                scroll='5m',
-                preserve_order=True,
-                request_timeout=self.config.ES_TIMEOUT,
-                headers={"Content-Type": "application/json"})
-            self.logger.success(f"Search completed successfully.")
+            self.logger.debug("Executing Elasticsearch sliced scan query...")
+            result = self._scanSliced(indexName, query)
+            self.logger.success(f"Search started successfully.")
             return result
         except Exception as e:
             self.logger.error(f"Error while searching data in index '{indexName}': {e}", exc_info=True)
             raise
 
-    def bulkIndex(self, chunk: list, actions: list):
-        self.logger.debug(f"Preparing {len(chunk)} documents for bulk indexing.")
-        
+    def prepareForBulk(self, index: str):
+        """
+        Relaxes refresh and replica settings on the target indices while
+        ingesting, snapshotting their current values for restoration.
+        """
+        self.logger.info(f"Preparing indices '{index}' for bulk ingest.")
+        try:
+            current = self.connectEs.indices.get_settings(
+                index=index,
+                ignore_unavailable=True,
+                allow_no_indices=True)
+            self._savedSettings = {
+                name: {
+                    "refresh_interval": entry["settings"]["index"].get("refresh_interval"),
+                    "number_of_replicas": entry["settings"]["index"].get("number_of_replicas")
+                }
+                for name, entry in current.items()
+            }
+
+            self.connectEs.indices.put_settings(
+                index=index,
+                body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+                ignore_unavailable=True,
+                allow_no_indices=True)
+        except Exception as e:
+            self.logger.warning(f"Could not prepare indices '{index}' for bulk ingest: {e}")
+
+    def ensureIngestIndex(self, indexName: str):
+        """
+        Pre-creates a split index with the relaxed ingest settings the first
+        time the stream emits it. The dated indices are otherwise created
+        lazily by the bulk itself, after prepareForBulk's wildcard ran, so
+        they would come up with default refresh and replica settings.
+        """
+        if indexName in self._preparedIndices or indexName in self._savedSettings:
+            return
+        self._preparedIndices.add(indexName)
+
+        try:
+            self.connectEs.indices.create(
+                index=indexName,
+                body={"settings": {"index": {"refresh_interval": "-1", "number_of_replicas": 0}}},
+                ignore=400)
+        except Exception as e:
+            self.logger.warning(f"Could not pre-create index '{indexName}' for bulk ingest: {e}")
+
+    def restoreAfterBulk(self, index: str):
+        """Restores refresh and replica settings on every split index once the ingest completes."""
+        self.logger.info(f"Restoring settings on indices '{index}' after bulk ingest.")
+        try:
+            current = self.connectEs.indices.get_settings(
+                index=index,
+                ignore_unavailable=True,
+                allow_no_indices=True)
+        except Exception as e:
+            self.logger.warning(f"Could not list indices '{index}' for restore: {e}")
+            current = {}
+
+        for name in current:
+            # Indices created during the ingest carry no snapshot; a None
+            # value resets the setting to the index default.
+            saved = self._savedSettings.get(
+                name, {"refresh_interval": None, "number_of_replicas": None})
+            try:
+                self.connectEs.indices.put_settings(
+                    index=name,
+                    body={"index": saved},
+                    ignore_unavailable=True,
+                    allow_no_indices=True)
+            except Exception as e:
+                self.logger.warning(f"Could not restore settings on index '{name}': {e}")
+        self._savedSettings = {}
+        self._preparedIndices.clear()
+
+        try:
+            self.connectEs.indices.refresh(
+                index=index,
+                ignore_unavailable=True,
+                allow_no_indices=True)
+        except Exception as e:
+            self.logger.warning(f"Could not refresh indices '{index}': {e}")
+
+    def bulkIndexStream(self, actions):
+        """
+        Streams actions through parallel_bulk across a bounded thread pool.
+
+        parallel_bulk maintains its own bounded per-pool queue internally,
+        so no Python-level Queue sits between chunking and the workers.
+        """
+        self.logger.debug("Starting parallel bulk indexing stream.")
+
+        try:
+            return parallel_bulk(
+                self.connectEs,
+                actions,
+                thread_count=numProcess(),
+                chunk_size=self.config.BATCH_SIZE,
+                max_chunk_bytes=self.config.MAX_CHUNK_BYTES,
+                queue_size=self.config.QUEUE_SIZE,
+                raise_on_error=False,
+                raise_on_exception=False,
+                request_timeout=self.config.ES_TIMEOUT)
+        except Exception as e:
+            self.logger.error(f"Parallel bulk indexing error: {str(e)}")
+            raise
+
+    def bulkIndex(self, actions: list):
+        self.logger.debug(f"Preparing {len(actions)} documents for bulk indexing.")
+
         try:
             success, failed = bulk(self.connectEs, actions, stats_only=True)
-            self.logger.success(f"Successfully indexed {len(chunk)}")
+            self.logger.success(f"Successfully indexed {success}")
             return success, failed
         except Exception as e:
             self.logger.error(f"Bulk indexing error: {str(e)}")
             raise
-        #     return 0, len(chunk)
-        # finally:
-        #     self.connectEs.close()
 
     def close(self):
         self.logger.info(f"Close connection Elasticsearch: {self.config.ES_URL}")
@@ -1,14 +1,23 @@
 from datetime import datetime
 from dataclasses import dataclass
-from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional
 from enum import Enum
 
 
-class MappingData(BaseModel):
-    dataId: str = Field(..., title="Data ID")
-    indexName: str = Field(..., title="Index Name")
-    data: Dict[str, Any] = Field(..., title="Data Result")
+@dataclass(slots=True)
+class MappingData:
+    """Mapped document ready for bulk indexing."""
+    dataId: str
+    indexName: str
+    data: Dict[str, Any]
+
+    def as_action(self):
+        """Returns the document as an Elasticsearch bulk action."""
+        return {
+            "_index": self.indexName,
+            "_id": self.dataId,
+            "_source": self.data
+        }
 
 
 class DateFormatter:
@@ -71,6 +80,9 @@ class EngineConfig:
     batch_size: int
     max_retry_connection: int
     format_date: DateFormats
+    max_chunk_bytes: int = 52428800
+    queue_size: int = 4
+    scan_size: int = 5000
 
 
 @dataclass
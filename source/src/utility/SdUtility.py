@@ -1,29 +1,31 @@
 import os
 import time
+import calendar
 import configparser
 
 from datetime import datetime, timezone
-from functools import reduce
+from functools import lru_cache
 from multiprocessing import cpu_count
 
 from src.model import DateFormatter
 
 
+@lru_cache(maxsize=1)
 def getConfigIni(file_path="config.ini"):
+    """Reads and parses the ini file once per process; cached thereafter."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Config file '{file_path}' not found.")
-    
+
     config = configparser.ConfigParser()
     config.read(file_path)
     return config
 
 
-def argToJson(**kwargs):
-    return kwargs
-
-
 def timestampToDate(timestamp: int, fmt: str):
-    dt: datetime = datetime.fromtimestamp(timestamp)
+    # Format in UTC so the date stays aligned with the epoch-day bucketing
+    # (timestamp // 86400) and the timegm-based query bounds, regardless of
+    # the host timezone.
+    dt: datetime = datetime.fromtimestamp(timestamp, tz=timezone.utc)
     formattedDt = DateFormatter.formateDate(dt, fmt)
     return formattedDt
 
@@ -31,42 +33,38 @@ def timestampToDate(timestamp: int, fmt: str):
 def dateToEpoch(dates: str, millis: bool = False):
     if isinstance(dates, str):
         year, month, day = (int(ymd) for ymd in dates.split("-"))
-        dt = datetime(year, month, day, tzinfo=timezone.utc)
-        
+        # Pure integer math; no datetime object or timezone conversion.
+        epoch = calendar.timegm((year, month, day, 0, 0, 0, 0, 0, 0))
+
         if millis:
-            epoch = int(dt.timestamp() * 1000)
-            return epoch
-        
-        epoch = int(dt.timestamp())
+            return epoch * 1000
+
         return epoch
 
     return None
 
 
-def validateTimestampQuery(
-        gte: str | None, lte: str| None, timestamp: int, 
-        gte_threshold: int | None, lte_threshold: int | None):
-    if gte and lte:
-        return timestamp >= gte_threshold and timestamp <= lte_threshold
-    elif gte:
-        return timestamp >= gte_threshold
-    elif lte:
-        return timestamp <= lte_threshold
-
-
 def templateIndex(index: str, date: str):
     return "{index}-{date}".format(index=index, date=date)
 
 
-def getNestedValue(data: dict, keys: str):
-    try:
-        return reduce(
-            lambda d, key: d.get(key, None) \
-                if isinstance(d, dict) else None, 
-                keys.split('.'), data)
-    except AttributeError:
-        return None
+def getNestedValue(data: dict, keys):
+    """Walks a nested dict along a pre-split key path (or dotted string)."""
+    if isinstance(keys, str):
+        keys = keys.split('.')
+
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+
+    return data
+
+
+_NUM_PROCESS = max(1, int( cpu_count() * 0.75 ))
 
 
 def numProcess():
-    return max(1, int( cpu_count() * 0.75 ))
\ No newline at end of file
+    return _NUM_PROCESS
\ No newline at end of file
@@ -1,7 +1,11 @@
 import socket
-from loguru import logger
-from datetime import datetime
-from urllib.parse import urlparse
+import logging
+import ipaddress
+import functools
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from datetime import date
+from types import MappingProxyType
 from typing import List, Optional, Tuple, Dict
 
 from src.utility.SdUtility import getConfigIni
@@ -15,24 +19,98 @@ from src.model import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+# Membership checks against the enums go through frozensets instead of the
+# raising enum constructor; the error strings are built once at import.
+_DATE_FORMAT_VALUES = frozenset(f.value for f in DateFormats)
+_ISO_FORMAT_VALUES = frozenset(f.value for f in IsoFormat)
+_SORT_ORDER_VALUES = frozenset(f.value for f in SortOrder)
+
+_ELASTIC_REQUIRED: Tuple[str, ...] = tuple(ElasticConfig.__annotations__)
+
+_DATE_FORMAT_ERR = f"Invalid format_date. Must be one of: {', '.join(f.value for f in DateFormats)}"
+_ISO_FORMAT_ERR = f"Invalid iso_format. Must be one of: {', '.join(f.value for f in IsoFormat)}"
+_SORT_ORDER_ERR = f"Invalid sort_order. Must be one of: {', '.join(f.value for f in SortOrder)}"
+
+# Parameterized messages are bound .format methods so the template string
+# is interned once instead of rebuilt at each failure site.
+_MISSING_FIELD_FMT = "Missing required field: {}".format
+_DATE_RANGE_FMT = "{} must be in YYYY-MM-DD format".format
+_RESOLVE_ERR_FMT = "Cannot resolve hostname: {}".format
+
+
+def _parse_bounded_int(value, lo, hi, name):
+    """Parses an integer and checks its bounds in one pass.
+
+    Returns (number, None) on success or (None, error_message) on failure.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None, f"{name} must be an integer"
+
+    if number < lo:
+        return None, f"{name} must be greater than equal to {lo}"
+    if hi is not None and number > hi:
+        return None, f"{name} must be less than equal to {hi}"
+    return number, None
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve(host: str) -> str:
+    """Resolves a hostname once per process; the es_url rarely changes."""
+    return socket.gethostbyname(host)
+
+
+# Resolution runs on a single background thread with a bounded wait so a
+# slow or misconfigured resolver cannot block startup for its full timeout.
+_DNS_TIMEOUT = 2.0
+_dns_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sd-dns")
+
+
+@functools.lru_cache(maxsize=64)
+def _validate_url(url: str) -> Tuple[str, ...]:
+    """Validate URL format and hostname resolution, memoized per URL."""
+    # Assume the canonical form up front: anything not http(s):// fails
+    # before any host extraction or DNS work happens.
+    if not url.startswith(("http://", "https://")):
+        return ("URL must start with http:// or https://",)
+
+    errors = []
+    add_err = errors.append
+    rest = url.split("://", 1)[1]
+    hostport = rest.split("/", 1)[0].rsplit("@", 1)[-1]
+    host = hostport.rsplit(":", 1)[0].lower() if ":" in hostport else hostport.lower()
+
+    if not host:
+        add_err("Invalid URL format: missing hostname")
+        return tuple(errors)
+
+    # An IP literal needs no DNS resolution.
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return tuple(errors)
+    except ValueError:
+        pass
+
+    try:
+        _dns_executor.submit(_resolve, host).result(timeout=_DNS_TIMEOUT)
+    except socket.gaierror:
+        add_err(_RESOLVE_ERR_FMT(host))
+    except FuturesTimeoutError:
+        # Soft warning only; the lookup keeps running and seeds the cache.
+        logger.warning("DNS resolution for '%s' exceeded %.1fs, skipping check", host, _DNS_TIMEOUT)
+    return tuple(errors)
+
+
 class ConfigValidator:
     """Base configuration validator with common validation methods."""
     @staticmethod
     def validate_url(url: str) -> List[str]:
         """Validate URL format and hostname resolution."""
-        errors = []
-        try:
-            parsed_url = urlparse(url)
-            if parsed_url.scheme not in ["http", "https"]:
-                errors.append("URL must start with http:// or https://")
-            
-            try:
-                socket.gethostbyname(parsed_url.hostname)
-            except socket.gaierror:
-                errors.append(f"Cannot resolve hostname: {parsed_url.hostname}")
-        except Exception as e:
-            errors.append(f"Invalid URL format: {str(e)}")
-        return errors
+        return list(_validate_url(url))
 
 class SdValidator:
     """
@@ -40,19 +118,24 @@ class SdValidator:
     
     Validates and manages configuration for Elasticsearch, Engine, and Query components.
     """
-    
+
+    logger = logger
+
     def __init__(self):
         """
         Initialize the validator with configuration dictionary.
-        
+
         Args:
             config: Configuration dictionary from ini file
         """
-        self.logger = logger
-        self.config = getConfigIni()
+        # Read-only view over the shared parsed config; validators must not
+        # mutate what other consumers of the cached parser see.
+        self.config = MappingProxyType(getConfigIni())
         self._elastic_config: Optional[ElasticConfig] = None
         self._engine_config: Optional[EngineConfig] = None
         self._query_config: Optional[QueryConfig] = None
+        self._validated: bool = False
+        self._errors: List[str] = []
 
     def validate_elastic_config(self) -> Tuple[bool, List[str]]:
         """
@@ -62,6 +145,7 @@ class SdValidator:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
+        add_err = errors.append
         
         try:
             if 'elastic' not in self.config:
@@ -70,31 +154,25 @@ class SdValidator:
             elastic_config = self.config['elastic']
             
             # Validate required fields
-            required_fields = ElasticConfig.__annotations__.keys()
-            missing_fields = [field for field in required_fields if field not in elastic_config]
+            missing_fields = [field for field in _ELASTIC_REQUIRED if field not in elastic_config]
             if missing_fields:
-                return False, [f"Missing required field: {field}" for field in missing_fields]
+                return False, [_MISSING_FIELD_FMT(field) for field in missing_fields]
             
             # Validate URL
             url_errors = ConfigValidator.validate_url(elastic_config['es_url'])
             errors.extend(url_errors)
             
             # Validate timeout
-            try:
-                timeout = int(elastic_config['es_timeout'])
-                if timeout <= 0:
-                    errors.append("es_timeout must be a positive integer")
-                elif timeout > 86400:
-                    errors.append("es_timeout must be less than equal to 86400 seconds")
-            except ValueError:
-                errors.append("es_timeout must be an integer")
+            timeout, err = _parse_bounded_int(elastic_config['es_timeout'], 1, 86400, 'es_timeout')
+            if err:
+                add_err(err)
             
             if not errors:
                 self._elastic_config = ElasticConfig(**elastic_config)
             
             return len(errors) == 0, errors
             
-        except Exception as e:
+        except (KeyError, TypeError) as e:
             return False, [f"Error validating elastic config: {str(e)}"]
 
     def validate_engine_config(self) -> Tuple[bool, List[str]]:
@@ -105,6 +183,7 @@ class SdValidator:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
+        add_err = errors.append
         
         try:
             if 'engine' not in self.config:
@@ -113,42 +192,52 @@ class SdValidator:
             engine_config = self.config['engine']
             
             # Validate batch size
-            try:
-                batch_size = int(engine_config['batch_size'])
-                if batch_size < 1:
-                    errors.append("batch_size must be greater than equal to 1")
-                elif batch_size > 1000:
-                    errors.append("batch_size must be less than equal to 1000")
-            except ValueError:
-                errors.append("batch_size must be an integer")
-            
+            batch_size, err = _parse_bounded_int(engine_config['batch_size'], 1, 1000, 'batch_size')
+            if err:
+                add_err(err)
+
             # Validate max retry connection
-            try:
-                max_retry_connection = int(engine_config['max_retry_connection'])
-                if max_retry_connection < 1:
-                    errors.append("max_retry_connection must be greater than to 1")
-                elif max_retry_connection > 10:
-                    errors.append("max_retry_connection must be less than equal to 10")
-            except ValueError:
-                errors.append("max_retry_connection must be an integer")
+            max_retry_connection, err = _parse_bounded_int(
+                engine_config['max_retry_connection'], 1, 10, 'max_retry_connection')
+            if err:
+                add_err(err)
+
+            # Validate max chunk bytes (optional, defaults to 50 MB)
+            max_chunk_bytes, err = _parse_bounded_int(
+                engine_config.get('max_chunk_bytes', 52428800), 1048576, None, 'max_chunk_bytes')
+            if err:
+                add_err(err)
+
+            # Validate queue size (optional, chunks buffered per bulk worker)
+            queue_size, err = _parse_bounded_int(
+                engine_config.get('queue_size', 4), 1, 64, 'queue_size')
+            if err:
+                add_err(err)
+
+            # Validate scan size (optional, documents per scroll page)
+            scan_size, err = _parse_bounded_int(
+                engine_config.get('scan_size', 5000), 1, 10000, 'scan_size')
+            if err:
+                add_err(err)
 
             # Validate date format
-            try:
-                format_date = engine_config['format_date']
-                DateFormats(format_date)
-            except ValueError:
-                errors.append(f"Invalid format_date. Must be one of: {', '.join(f.value for f in DateFormats)}")
-            
+            format_date = engine_config['format_date']
+            if format_date not in _DATE_FORMAT_VALUES:
+                add_err(_DATE_FORMAT_ERR)
+
             if not errors:
                 self._engine_config = EngineConfig(
                     batch_size=batch_size,
                     max_retry_connection=max_retry_connection,
-                    format_date=format_date
+                    format_date=format_date,
+                    max_chunk_bytes=max_chunk_bytes,
+                    queue_size=queue_size,
+                    scan_size=scan_size
                 )
             
             return len(errors) == 0, errors
             
-        except Exception as e:
+        except (KeyError, TypeError) as e:
             return False, [f"Error validating engine config: {str(e)}"]
 
     def validate_query_config(self) -> Tuple[bool, List[str]]:
@@ -159,6 +248,7 @@ class SdValidator:
             Tuple of (is_valid, list_of_errors)
         """
         errors = []
+        add_err = errors.append
         
         try:
             if 'query' not in self.config:
@@ -166,70 +256,103 @@ class SdValidator:
             
             query_config = self.config['query']
             
-            # Validate used_query
-            used_query = query_config.get('used_query', 'no').lower()
-            if used_query not in ['yes', 'no']:
-                errors.append("used_query must be 'yes' or 'no'")
+            # Validate used_query; values are usually lowercase already, so
+            # only fall back to .lower() when the fast check misses.
+            used_query = query_config.get('used_query', 'no')
+            if used_query not in ('yes', 'no'):
+                used_query = used_query.lower()
+                if used_query not in ('yes', 'no'):
+                    add_err("used_query must be 'yes' or 'no'")
             
             # Validate dates if present
-            for date_field in ['gte', 'lte']:
-                if date_field in query_config and query_config[date_field]:
-                    try:
-                        datetime.strptime(query_config[date_field], '%Y-%m-%d')
-                    except ValueError:
-                        errors.append(f"{date_field} must be in YYYY-MM-DD format")
-
-            # Validate iso format
-            if 'iso_format' in query_config:
+            for date_field in ('gte', 'lte'):
+                date_value = query_config.get(date_field)
+                if not date_value:
+                    continue
                 try:
-                    IsoFormat(query_config["iso_format"])
+                    date.fromisoformat(date_value)
                 except ValueError:
-                    errors.append(f"Invalid iso_format. Must be one of: {', '.join(f.value for f in IsoFormat)}")
+                    add_err(_DATE_RANGE_FMT(date_field))
+
+            # Validate iso format
+            iso_format = query_config.get('iso_format')
+            if iso_format is not None and iso_format not in _ISO_FORMAT_VALUES:
+                add_err(_ISO_FORMAT_ERR)
+
+            # Validate sort order with the same lowercase fast path
+            sort_order = query_config.get('sort_order', 'asc')
+            if sort_order not in _SORT_ORDER_VALUES:
+                sort_order = sort_order.lower()
+                if sort_order not in _SORT_ORDER_VALUES:
+                    add_err(_SORT_ORDER_ERR)
 
-            # Validate sort order
-            if 'sort_order' in query_config:
-                try:
-                    SortOrder(query_config['sort_order'].lower())
-                except ValueError:
-                    errors.append(f"Invalid sort_order. Must be one of: {', '.join(f.value for f in SortOrder)}")
-            
             if not errors:
                 self._query_config = QueryConfig(
                     used_query=used_query,
                     gte=query_config.get('gte'),
                     lte=query_config.get('lte'),
                     iso_format=query_config.get('iso_format'),
-                    sort_order=query_config.get('sort_order', 'asc').lower()
+                    sort_order=sort_order
                 )
             
             return len(errors) == 0, errors
             
-        except Exception as e:
+        except (KeyError, TypeError) as e:
             return False, [f"Error validating query config: {str(e)}"]
 
+    def validate_all(self) -> Tuple[bool, List[str]]:
+        """
+        Validate all configuration sections in a single pass.
+
+        Returns:
+            Tuple of (is_valid, list_of_errors) covering every section
+        """
+        if self._validated:
+            return not self._errors, self._errors
+
+        errors = []
+        for validate in (
+                self.validate_elastic_config,
+                self.validate_engine_config,
+                self.validate_query_config):
+            _, section_errors = validate()
+            errors.extend(section_errors)
+
+        self._validated = True
+        self._errors = errors
+        return not errors, errors
+
     def get_elastic_config(self) -> Optional[ElasticConfig]:
         """Get validated Elasticsearch configuration."""
+        if not self._validated:
+            self.validate_all()
         if self._elastic_config is None:
-            is_valid, errors = self.validate_elastic_config()
-            if not is_valid:
-                self.logger.error("Invalid Elasticsearch configuration: %s", errors)
-                return None
+            self.logger.error("Invalid Elasticsearch configuration: %s", self._errors)
         return self._elastic_config
 
     def get_engine_config(self) -> Optional[EngineConfig]:
         """Get validated Engine configuration."""
+        if not self._validated:
+            self.validate_all()
         if self._engine_config is None:
-            is_valid, errors = self.validate_engine_config()
-            if not is_valid:
-                self.logger.error("Invalid Engine configuration: %s", errors)
-                return None
+            self.logger.error("Invalid Engine configuration: %s", self._errors)
         return self._engine_config
 
     def get_query_config(self) -> Optional[QueryConfig]:
         """Get validated Query configuration."""
+        if not self._validated:
+            self.validate_all()
         if self._query_config is None:
-            is_valid, errors = self.validate_query_config()
-            if not is_valid:
-                self.logger.error("Invalid Query configuration: %s", errors)
-                return None
+            self.logger.error("Invalid Query configuration: %s", self._errors)
         return self._query_config
+
+
+_validator: Optional[SdValidator] = None
+
+
+def get_validator() -> SdValidator:
+    """Returns the process-wide SdValidator, creating it on first use."""
+    global _validator
+    if _validator is None:
+        _validator = SdValidator()
+    return _validator